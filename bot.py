@@ -8,12 +8,15 @@ from dotenv import load_dotenv
 
 from lib.bot import TradingBot
 from lib.providers import ChatGPTProvider, ClaudeProvider
-from lib.analysis import get_top_traders_by_sharpe, find_consensus_bets
-from lib.visualization import create_visualizations
 
 
 def run_analysis(args):
     """Run trader analysis and generate visualizations."""
+    # Imported here so the trade command doesn't pay the matplotlib/numpy
+    # import cost on startup
+    from lib.analysis import get_top_traders_by_sharpe, find_consensus_bets
+    from lib.visualization import create_visualizations
+
     print("=" * 80)
     print("POLYMARKET TOP TRADERS ANALYSIS")
     print("=" * 80)
@@ -93,7 +96,17 @@ def run_trading(args):
     if ai_provider_name == 'bedrock':
         try:
             import boto3
-            bedrock_client = boto3.client('bedrock-runtime')
+            from botocore.config import Config
+
+            # One client for the whole session: bigger connection pool keeps
+            # the TLS socket warm across iterations, and botocore retries are
+            # disabled so they don't stack with the provider's backoff loop
+            bedrock_client = boto3.client('bedrock-runtime', config=Config(
+                max_pool_connections=16,
+                retries={'mode': 'standard', 'total_max_attempts': 1},
+                connect_timeout=10,
+                read_timeout=120
+            ))
             ai_provider = ClaudeProvider(bedrock_client)
             print("   Model: Claude Opus 4 via AWS Bedrock")
             print("✅ Connected to AWS Bedrock")
@@ -172,7 +185,10 @@ def run_trading(args):
     )
     
     # Run trading session
-    bot.run_trading_session(max_iterations=args.max_iterations)
+    bot.run_trading_session(
+        max_iterations=args.max_iterations,
+        iteration_delay=args.iteration_delay
+    )
 
 
 def main():
@@ -221,6 +237,12 @@ Examples:
         '--api-key',
         help='OpenAI API key (or set OPENAI_API_KEY env var)'
     )
+    trade_parser.add_argument(
+        '--iteration-delay',
+        type=float,
+        default=1.0,
+        help='Pause in seconds between AI iterations (default: 1.0)'
+    )
     trade_parser.add_argument(
         '--live',
         action='store_true',
@@ -262,6 +284,7 @@ Examples:
         args.api_key = None
         args.live = False
         args.max_bet_pct = 1.0
+        args.iteration_delay = 1.0
     
     # Route to appropriate command
     if args.command == 'analyze':
@@ -1,14 +1,74 @@
+import heapq
 import requests
 import json
-import statistics
+import time
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict, Counter
 from dataclasses import dataclass
-import argparse
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from datetime import datetime
-import numpy as np
+from itertools import accumulate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import numpy as np
+except ImportError:
+    # Pure-stdlib fallbacks below keep the calculators O(N) without numpy
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from .log import logger
+from .repositories.base import decode_json
+
+
+# Shared keep-alive session: one warm TLS connection pool for the whole
+# leaderboard sweep instead of a fresh handshake per request. Session.get is
+# thread-safe, so the analysis thread pools share it too.
+# Transient 5xx responses get a few quick retries with backoff so one bad
+# response doesn't stall a sweep; connect failures surface fast via the
+# split (connect, read) timeouts at the call sites.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=('GET',)
+)
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_RETRY))
+
+
+def _pnl_loop(side_codes, sizes, prices, out):
+    """Position/avg-cost state machine over parallel arrays.
+
+    side_codes is 1 for BUY, -1 for SELL, 0 otherwise. SELL P&L entries are
+    written into out; returns (count, position_size, position_cost) so the
+    caller can settle any open remainder. JIT-compiled when numba is
+    installed - the loop is pure scalar arithmetic in nopython mode.
+    """
+    count = 0
+    pos = 0.0
+    cost = 0.0
+    for i in range(side_codes.shape[0]):
+        code = side_codes[i]
+        if code == 1:
+            cost += sizes[i] * prices[i]
+            pos += sizes[i]
+        elif code == -1 and pos > 0:
+            avg_cost = cost / pos
+            out[count] = sizes[i] * (prices[i] - avg_cost)
+            count += 1
+            cost -= sizes[i] * avg_cost
+            pos -= sizes[i]
+    return count, pos, cost
+
+
+if njit is not None:
+    _pnl_loop = njit(cache=True)(_pnl_loop)
 
 
 @dataclass
@@ -42,9 +102,19 @@ class TradeInfo:
 
 class PolymarketAPI:
     """Client for Polymarket Data API."""
-    
+
     BASE_URL = "https://data-api.polymarket.com"
-    
+
+    # Cache for trade fetches - analyze_trader, get_top_volume_trades, and
+    # find_consensus_bets all pull the same wallets within one run
+    _trades_cache = {}
+    _TRADES_TTL = 300
+
+    # The data-api serves at most this many rows per request regardless of
+    # the requested limit; a response at any cap may have truncated an
+    # individual wallet's slice
+    _BATCH_ROW_CAP = 500
+
     @staticmethod
     def get_leaderboard(limit: int = 100) -> List[Dict]:
         """
@@ -53,32 +123,88 @@ class PolymarketAPI:
         Note: API has a hard limit of ~50 traders regardless of requested limit.
         """
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f"{PolymarketAPI.BASE_URL}/v1/leaderboard",
                 params={'limit': limit},
-                timeout=10
+                timeout=(3, 7)
             )
             if response.ok:
-                return response.json()
+                return decode_json(response)
         except Exception as e:
             print(f"Error fetching leaderboard: {e}")
         return []
     
     @staticmethod
     def get_trades(wallet: str, limit: int = 500) -> List[Dict]:
-        """Get trade history for a wallet."""
+        """Get trade history for a wallet, cached per (wallet, limit)."""
+        cache_key = (wallet, limit)
+        cached = PolymarketAPI._trades_cache.get(cache_key)
+        if cached and time.time() - cached[0] < PolymarketAPI._TRADES_TTL:
+            return cached[1]
+
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f"{PolymarketAPI.BASE_URL}/trades",
                 params={'user': wallet, 'limit': limit},
-                timeout=10
+                timeout=(3, 7)
             )
             if response.ok:
-                return response.json()
+                trades = decode_json(response)
+                PolymarketAPI._trades_cache[cache_key] = (time.time(), trades)
+                return trades
         except Exception as e:
             print(f"Error fetching trades: {e}")
         return []
 
+    @staticmethod
+    def get_trades_batch(wallets: List[str], limit: int = 500) -> Dict[str, List[Dict]]:
+        """
+        Fetch trade histories for several wallets at once.
+
+        Tries the data-api's comma-separated user form first so K wallets
+        cost one round-trip. The batch only primes the get_trades cache
+        when the response is provably untruncated - fewer rows than both
+        the requested budget and the API's per-request cap - because a
+        capped response silently truncates individual wallets' slices.
+        Anything else falls back to per-wallet fetches for every wallet.
+        """
+        wallets = [w for w in wallets if w]
+        if not wallets:
+            return {}
+
+        rows = None
+        try:
+            response = _SESSION.get(
+                f"{PolymarketAPI.BASE_URL}/trades",
+                params={'user': ','.join(wallets), 'limit': limit * len(wallets)},
+                timeout=(3, 27)
+            )
+            if response.ok:
+                rows = decode_json(response)
+        except Exception:
+            rows = None
+
+        # A complete response proves every wallet's slice is its full
+        # history (zero rows really means tradeless), so caching is safe
+        if rows is not None and len(rows) < min(limit * len(wallets), PolymarketAPI._BATCH_ROW_CAP):
+            by_wallet = {w: [] for w in wallets}
+            for trade in rows:
+                wallet = trade.get('proxyWallet', '')
+                if wallet in by_wallet:
+                    by_wallet[wallet].append(trade)
+
+            now = time.time()
+            for wallet, trades in by_wallet.items():
+                PolymarketAPI._trades_cache[(wallet, limit)] = (now, trades)
+            return by_wallet
+
+        # Truncated or failed batch: per-wallet fetches for every wallet
+        # (get_trades caches each)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = executor.map(lambda w: PolymarketAPI.get_trades(w, limit), wallets)
+        return dict(zip(wallets, results))
+
 
 class SharpeCalculator:
     """Calculate Sharpe ratio from trade data."""
@@ -90,7 +216,7 @@ class SharpeCalculator:
     def _check_market_resolution_by_clob(asset_id: str) -> bool:
         """Check if market is resolved by checking if it's delisted from CLOB."""
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 'https://clob.polymarket.com/price',
                 params={'token_id': asset_id, 'side': 'BUY'},
                 timeout=3
@@ -104,12 +230,12 @@ class SharpeCalculator:
     def _get_market_by_slug(slug: str) -> Optional[Dict]:
         """Get market info by slug from Gamma API."""
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f'https://gamma-api.polymarket.com/markets/slug/{slug}',
                 timeout=3
             )
             if response.ok:
-                return response.json()
+                return decode_json(response)
         except Exception:
             pass
         return None
@@ -138,13 +264,13 @@ class SharpeCalculator:
         
         # Fallback to condition_id lookup
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 'https://gamma-api.polymarket.com/markets',
                 params={'condition_id': condition_id},
                 timeout=3
             )
             if response.ok:
-                markets = response.json()
+                markets = decode_json(response)
                 if markets:
                     market_info = markets[0]
                     # Override closed status if CLOB check confirms resolution
@@ -164,33 +290,56 @@ class SharpeCalculator:
         Calculate returns from:
         1. Explicit SELL trades (manual exits)
         2. Resolved markets (automatic redemption) - OPTIONAL, slow
-        
+
         Args:
             trades: List of trade dictionaries
             check_resolutions: If True, check market resolutions (slow). Default False for speed.
-        
+
         Note: Setting check_resolutions=True makes API calls to check market resolution status.
         For large trade histories, this may be slow. Use False for faster analysis.
         """
+        return SharpeCalculator.scan_trades(trades, check_resolutions)[0]
+
+    @staticmethod
+    def scan_trades(trades: List[Dict], check_resolutions: bool = False) -> Tuple[List[float], int]:
+        """
+        Single fused pass over a trade list: returns (returns, win_count).
+
+        Groups trades by market, runs the per-position P&L state machine, and
+        counts profitable SELL exits in the same traversal so the trade list
+        streams through once instead of once per metric. win_count matches
+        calculate_win_rate's numerator (SELL with price > 0.5).
+        """
         if not trades:
-            return []
-        
+            return [], 0
+
         # Group trades by market and outcome, storing asset_id and slug for resolution checks
         from collections import defaultdict
         market_positions = defaultdict(lambda: defaultdict(lambda: {
-            'size': 0, 
-            'cost': 0, 
-            'trades': [], 
+            'size': 0,
+            'cost': 0,
+            'trades': [],
             'asset_id': None,
             'slug': None
         }))
-        
+
+        win_count = 0
+
         # Reverse to process chronologically
         for trade in reversed(trades):
             condition_id = trade.get('conditionId', '')
             outcome = trade.get('outcome', '')
             asset_id = trade.get('asset', '')
             slug = trade.get('slug', '')
+
+            # Profitable-exit count folded into the same walk
+            if trade.get('side') == 'SELL':
+                try:
+                    if float(trade.get('price', 0)) > 0.5:
+                        win_count += 1
+                except (ValueError, TypeError):
+                    pass
+
             if condition_id and outcome:
                 market_positions[condition_id][outcome]['trades'].append(trade)
                 # Store asset_id and slug for resolution checks
@@ -204,30 +353,49 @@ class SharpeCalculator:
         # Calculate P&L for each market/outcome combination
         for condition_id, outcomes in market_positions.items():
             for outcome, data in outcomes.items():
-                position_size = 0
-                position_cost = 0
+                position_size = 0.0
+                position_cost = 0.0
                 asset_id = data['asset_id']
                 slug = data['slug']
-                
+
+                # Pre-parse the trade fields once so the position state
+                # machine below runs over plain floats with no dict lookups
+                # or casts per step; malformed entries are dropped up front
+                parsed = []
                 for trade in data['trades']:
                     try:
-                        side = trade.get('side', '')
-                        size = float(trade.get('size', 0))
-                        price = float(trade.get('price', 0))
-                        
+                        parsed.append((
+                            trade.get('side', ''),
+                            float(trade.get('size', 0)),
+                            float(trade.get('price', 0))
+                        ))
+                    except (ValueError, TypeError):
+                        continue
+
+                if np is not None and njit is not None and parsed:
+                    # Hand the state machine to the JIT-compiled kernel over
+                    # typed arrays (sides encoded BUY=1 / SELL=-1)
+                    n_trades = len(parsed)
+                    side_codes = np.fromiter(
+                        (1 if s == 'BUY' else (-1 if s == 'SELL' else 0) for s, _, _ in parsed),
+                        dtype=np.int8, count=n_trades)
+                    sizes = np.fromiter((sz for _, sz, _ in parsed), dtype=np.float64, count=n_trades)
+                    prices = np.fromiter((p for _, _, p in parsed), dtype=np.float64, count=n_trades)
+                    out = np.empty(n_trades, dtype=np.float64)
+
+                    n_pnl, position_size, position_cost = _pnl_loop(side_codes, sizes, prices, out)
+                    returns.extend(out[:n_pnl].tolist())
+                else:
+                    for side, size, price in parsed:
                         if side == 'BUY':
                             position_cost += size * price
                             position_size += size
-                        elif side == 'SELL':
-                            if position_size > 0:
-                                avg_cost = position_cost / position_size if position_size > 0 else 0
-                                pnl = size * (price - avg_cost)
-                                returns.append(pnl)
-                                
-                                position_cost -= size * avg_cost
-                                position_size -= size
-                    except (ValueError, TypeError, ZeroDivisionError):
-                        continue
+                        elif side == 'SELL' and position_size > 0:
+                            avg_cost = position_cost / position_size
+                            returns.append(size * (price - avg_cost))
+
+                            position_cost -= size * avg_cost
+                            position_size -= size
                 
                 # Only check resolutions if explicitly requested (slow operation)
                 if check_resolutions and position_size > 0:
@@ -278,76 +446,89 @@ class SharpeCalculator:
                         except (ValueError, IndexError, TypeError):
                             pass
         
-        return returns if returns else [0.0]
+        return (returns if returns else [0.0]), win_count
     
     @staticmethod
     def calculate_sharpe_ratio(returns: List[float], risk_free_rate: float = 0.0) -> float:
         """Calculate Sharpe ratio."""
         if len(returns) < 2:
             return 0.0
-        
-        try:
+
+        if np is not None:
+            arr = np.asarray(returns, dtype=np.float64)
+            mean_return = float(arr.mean())
+            std_dev = float(arr.std(ddof=1))
+        else:
+            import statistics
             mean_return = statistics.mean(returns)
             std_dev = statistics.stdev(returns)
-            
-            if std_dev == 0:
-                return 0.0
-            
-            sharpe = (mean_return - risk_free_rate) / std_dev
-            return sharpe
-        except statistics.StatisticsError:
+
+        if std_dev == 0:
             return 0.0
+
+        return (mean_return - risk_free_rate) / std_dev
     
     @staticmethod
     def calculate_max_drawdown(returns: List[float]) -> float:
         """
         Calculate maximum drawdown from peak equity.
-        
+
+        The inputs are per-trade dollar P&L values from scan_trades (not
+        fractional returns), so the equity curve is their cumulative sum and
+        drawdown is measured against the running peak, normalized by the
+        peak's magnitude. A cumprod(1 + r) wealth formulation is wrong here:
+        P&L routinely exceeds +/-1 and negative wealth flips the sign.
+
         Args:
             returns: List of returns (P&L from each trade/resolution)
-            
+
         Returns:
             Maximum drawdown as a percentage (negative value)
         """
         if not returns or len(returns) == 0:
             return 0.0
-        
-        # Calculate cumulative equity curve
-        cumulative = [sum(returns[:i+1]) for i in range(len(returns))]
-        
-        # Track peak and max drawdown
-        peak = cumulative[0]
-        max_dd = 0.0
-        
-        for value in cumulative:
-            # Update peak if we have a new high
-            if value > peak:
-                peak = value
-            
-            # Calculate drawdown from peak
-            if peak > 0:
-                drawdown = ((value - peak) / peak) * 100
-                max_dd = min(max_dd, drawdown)
-            elif peak < 0:
-                # If peak is negative, we're in a loss position
-                # Drawdown is still calculated but interpretation differs
-                drawdown = ((value - peak) / abs(peak)) * 100
-                max_dd = min(max_dd, drawdown)
-        
-        return max_dd
+
+        if np is not None:
+            arr = np.asarray(returns, dtype=np.float64)
+            cumulative = np.cumsum(arr)
+            peak = np.maximum.accumulate(cumulative)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                drawdowns = np.where(peak != 0, (cumulative - peak) / np.abs(peak), 0.0)
+
+            return min(0.0, float(drawdowns.min()) * 100)
+
+        # Stdlib path: itertools.accumulate keeps the cumulative equity and
+        # running peak O(N) instead of the old quadratic slice-sums
+        cumulative = list(accumulate(returns))
+        peak = accumulate(cumulative, max)
+        drawdowns = ((c - p) / abs(p) for c, p in zip(cumulative, peak) if p != 0)
+
+        return min(0.0, min(drawdowns, default=0.0) * 100)
     
     @staticmethod
     def calculate_win_rate(trades: List[Dict]) -> float:
         """Calculate win rate from trades."""
         if not trades:
             return 0.0
-        
-        profitable_trades = sum(
-            1 for trade in trades
-            if trade.get('side') == 'SELL' and float(trade.get('price', 0)) > 0.5
-        )
-        
-        return (profitable_trades / len(trades)) * 100 if trades else 0.0
+
+        if np is not None:
+            # One pass builds a float array (non-SELL trades map to 0.0),
+            # then a single vectorized comparison counts profitable exits
+            sell_prices = np.fromiter(
+                (float(trade.get('price', 0)) if trade.get('side') == 'SELL' else 0.0
+                 for trade in trades),
+                dtype=np.float64,
+                count=len(trades)
+            )
+            profitable_trades = int((sell_prices > 0.5).sum())
+        else:
+            profitable_trades = sum(
+                1 for trade in trades
+                if trade.get('side') == 'SELL' and float(trade.get('price', 0)) > 0.5
+            )
+
+        return (profitable_trades / len(trades)) * 100
 
 
 def analyze_trader(
@@ -371,23 +552,30 @@ def analyze_trader(
         check_resolutions: Check market resolutions (slow, default: False for speed)
     """
     trades = PolymarketAPI.get_trades(wallet)
-    
+
     if not trades:
         return None
-    
-    # Calculate metrics - skip resolution checks for speed
-    returns = SharpeCalculator.calculate_returns_from_trades(trades, check_resolutions=check_resolutions)
+
+    # Calculate metrics in one fused pass - skip resolution checks for speed
+    returns, win_count = SharpeCalculator.scan_trades(trades, check_resolutions=check_resolutions)
     
     # Use only last N returns for Sharpe ratio and max drawdown
     recent_returns = returns[-recent_trades_window:] if len(returns) > recent_trades_window else returns
-    
-    sharpe_ratio = SharpeCalculator.calculate_sharpe_ratio(recent_returns)
-    win_rate = SharpeCalculator.calculate_win_rate(trades)
+
+    # Single mean/std pass feeds avg return, volatility, and Sharpe
+    if np is not None:
+        recent_arr = np.asarray(recent_returns, dtype=np.float64)
+        avg_return = float(recent_arr.mean()) if recent_arr.size else 0.0
+        volatility = float(recent_arr.std(ddof=1)) if recent_arr.size > 1 else 0.0
+    else:
+        import statistics
+        avg_return = statistics.mean(recent_returns) if recent_returns else 0.0
+        volatility = statistics.stdev(recent_returns) if len(recent_returns) > 1 else 0.0
+    sharpe_ratio = avg_return / volatility if volatility > 0 else 0.0
+
+    win_rate = (win_count / len(trades)) * 100
     max_drawdown = SharpeCalculator.calculate_max_drawdown(recent_returns)
     
-    avg_return = statistics.mean(recent_returns) if recent_returns else 0.0
-    volatility = statistics.stdev(recent_returns) if len(recent_returns) > 1 else 0.0
-    
     return TraderMetrics(
         wallet=wallet,
         username=username,
@@ -417,27 +605,50 @@ def get_top_traders_by_sharpe(n: int = 10, sample_size: int = 50) -> List[Trader
     if not leaderboard:
         print("Failed to fetch leaderboard")
         return []
-    
+
+    # Placeholder rows without a proxy wallet or with zero volume have no
+    # trade history - drop them before they cost a /trades round-trip each
+    eligible = [t for t in leaderboard if t.get('proxyWallet') and float(t.get('vol', 0)) > 0]
+    skipped = len(leaderboard) - len(eligible)
+    if skipped:
+        print(f"✓ Skipped {skipped} placeholder entries (no wallet or zero volume)")
+    leaderboard = eligible
+
     actual_count = len(leaderboard)
     print(f"✓ Received {actual_count} traders from API (API limit: ~50)")
     print(f"Analyzing all {actual_count} traders to calculate Sharpe ratios...")
     print("-" * 80)
     
     traders = []
-    
-    for i, trader_info in enumerate(leaderboard, 1):
-        wallet = trader_info.get('proxyWallet', '')
-        username = trader_info.get('userName', 'Unknown')
-        vol = float(trader_info.get('vol', 0))
-        pnl = float(trader_info.get('pnl', 0))
-        
-        display_name = username[:30] + "..." if len(username) > 30 else username
-        
-        print(f"[{i}/{actual_count}] Analyzing {display_name}")
-        
-        metrics = analyze_trader(wallet, username, i, vol, pnl)
-        if metrics and metrics.total_trades > 0:
-            traders.append(metrics)
+
+    # Extract the per-trader fields in one parse pass up front; the sweep
+    # below then works over plain arrays instead of repeated dict lookups
+    wallets = [t.get('proxyWallet', '') for t in leaderboard]
+    usernames = [t.get('userName', 'Unknown') for t in leaderboard]
+    vols = [float(t.get('vol', 0)) for t in leaderboard]
+    pnls = [float(t.get('pnl', 0)) for t in leaderboard]
+
+    # Warm the trades cache with one batched fetch so the per-trader
+    # analysis below mostly hits cache instead of issuing its own requests
+    PolymarketAPI.get_trades_batch(wallets)
+
+    # Each analysis blocks on a /trades round-trip with no data dependencies
+    # between traders, so fan the sweep out across a thread pool
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {}
+        for idx in range(len(leaderboard)):
+            futures[executor.submit(
+                analyze_trader, wallets[idx], usernames[idx], idx + 1,
+                vols[idx], pnls[idx]
+            )] = idx
+
+        for done, future in enumerate(as_completed(futures), 1):
+            logger.info("[%d/%d] Analyzed trader", done, actual_count)
+            metrics = future.result()
+            if metrics and metrics.total_trades > 0:
+                traders.append(metrics)
     
     # Sort by Sharpe ratio
     traders.sort(key=lambda x: x.sharpe_ratio, reverse=True)
@@ -454,37 +665,49 @@ def get_top_volume_trades(wallet: str, n: int = 3) -> List[TradeInfo]:
     
     trades = PolymarketAPI.get_trades(wallet, limit=500)
     markets_repo = MarketsRepository()
-    
-    trade_infos = []
+
+    # A wallet's trades concentrate on few markets, and each is_active call
+    # is a gamma round-trip - check each distinct slug once
+    active_by_slug = {}
+
+    candidates = []
     for trade in trades:
         try:
             market_slug = trade.get('slug', '')
-            
+            if not market_slug:
+                continue
+
             # Skip if market is not active
-            if not market_slug or not markets_repo.is_active(market_slug):
+            is_active = active_by_slug.get(market_slug)
+            if is_active is None:
+                is_active = markets_repo.is_active(market_slug)
+                active_by_slug[market_slug] = is_active
+            if not is_active:
                 continue
-            
+
             size = float(trade.get('size', 0))
             price = float(trade.get('price', 0))
-            value = size * price
-            
-            trade_infos.append(TradeInfo(
-                market_title=trade.get('title', 'Unknown'),
-                market_slug=market_slug,
-                outcome=trade.get('outcome', 'N/A'),
-                side=trade.get('side', 'N/A'),
-                size=size,
-                price=price,
-                value=value,
-                timestamp=trade.get('timestamp', 0)
-            ))
+            candidates.append((size * price, size, price, trade))
         except (ValueError, TypeError):
             continue
-    
-    # Sort by value
-    trade_infos.sort(key=lambda x: x.value, reverse=True)
-    
-    return trade_infos[:n]
+
+    # Top-k selection beats a full sort, and TradeInfo objects are only
+    # built for the trades that actually make the cut
+    top = heapq.nlargest(n, candidates, key=lambda c: c[0])
+
+    return [
+        TradeInfo(
+            market_title=trade.get('title', 'Unknown'),
+            market_slug=trade.get('slug', ''),
+            outcome=trade.get('outcome', 'N/A'),
+            side=trade.get('side', 'N/A'),
+            size=size,
+            price=price,
+            value=value,
+            timestamp=trade.get('timestamp', 0)
+        )
+        for value, size, price, trade in top
+    ]
 
 
 def find_consensus_bets(traders: List[TraderMetrics]) -> List[Tuple[str, str, int, float]]:
@@ -501,33 +724,40 @@ def find_consensus_bets(traders: List[TraderMetrics]) -> List[Tuple[str, str, in
     
     # Track (market_slug, outcome) -> list of (wallet, volume)
     bet_tracker = defaultdict(list)
-    
+
+    # Memoized per run - traders overlap heavily on markets, and is_active
+    # costs one gamma round-trip per distinct slug
+    active_by_slug = {}
+
     for trader in traders:
         trades = PolymarketAPI.get_trades(trader.wallet, limit=500)
-        
+
         # Group by market and outcome
-        market_bets = defaultdict(float)
-        
+        market_bets = Counter()
+
         for trade in trades:
             market_slug = trade.get('slug', '')
             outcome = trade.get('outcome', '')
-            side = trade.get('side', '')
-            
-            # Skip if not active market
-            if not market_slug or not markets_repo.is_active(market_slug):
+
+            # Cheap filters first so inactive-market checks only run for
+            # trades that could actually count
+            if not market_slug or not outcome or trade.get('side') != 'BUY':
                 continue
-            
-            if outcome and side == 'BUY':
-                size = float(trade.get('size', 0))
-                price = float(trade.get('price', 0))
-                value = size * price
-                
-                key = (market_slug, outcome)
-                market_bets[key] += value
-        
+
+            is_active = active_by_slug.get(market_slug)
+            if is_active is None:
+                is_active = markets_repo.is_active(market_slug)
+                active_by_slug[market_slug] = is_active
+            if not is_active:
+                continue
+
+            size = float(trade.get('size', 0))
+            price = float(trade.get('price', 0))
+            market_bets[(market_slug, outcome)] += size * price
+
         # Add to tracker
-        for (market_slug, outcome), volume in market_bets.items():
-            bet_tracker[(market_slug, outcome)].append((trader.wallet, volume))
+        for key, volume in market_bets.items():
+            bet_tracker[key].append((trader.wallet, volume))
     
     # Find consensus (2+ traders on same bet)
     consensus_bets = []
@@ -538,8 +768,7 @@ def find_consensus_bets(traders: List[TraderMetrics]) -> List[Tuple[str, str, in
             avg_volume = sum(vol for _, vol in traders_list) / trader_count
             consensus_bets.append((market_slug, outcome, trader_count, avg_volume))
     
-    # Sort by trader count, then by volume
-    consensus_bets.sort(key=lambda x: (x[2], x[3]), reverse=True)
-    
-    return consensus_bets
+    # Only the top 20 are ever displayed or acted on, so a top-k selection
+    # by (trader count, volume) replaces the full sort
+    return heapq.nlargest(20, consensus_bets, key=lambda x: (x[2], x[3]))
 
@@ -11,6 +11,36 @@ from .trading import BetPlacer
 from .tools import get_all_tools
 
 
+# Informational tools whose results are stable within a session - safe to
+# serve from cache on repeat calls instead of re-running them
+_CACHEABLE_TOOLS = {'read_knowledge_base', 'get_suggested_whales'}
+
+# Tools that mutate state - always executed serially, in issue order
+_WRITE_TOOLS = {'place_bet'}
+
+
+def _preview(serialized: str, n: int = 200) -> str:
+    """Truncate an already-serialized payload for console output."""
+    return serialized if len(serialized) <= n else serialized[:n] + "..."
+
+
+# Number of most-recent tool results kept verbatim in the message history;
+# older ones are elided so the request body doesn't grow quadratically
+_TOOL_HISTORY_KEEP = 6
+
+
+def _trim_tool_history(messages):
+    """Replace older tool-result payloads with compact summaries in place."""
+    tool_indices = [i for i, m in enumerate(messages) if m.get('role') == 'tool']
+    for i in tool_indices[:-_TOOL_HISTORY_KEEP]:
+        content = messages[i].get('content', '')
+        if len(content) > 200 and not content.startswith('{"_elided"'):
+            messages[i]['content'] = json.dumps({
+                "_elided": True,
+                "summary": content[:160] + "..."
+            })
+
+
 class TradingBot:
     """AI-powered Polymarket trading bot."""
     
@@ -63,17 +93,87 @@ class TradingBot:
         # Initialize tool executor and bet placer
         self.bet_placer = BetPlacer(self)
         self.tools = {tool.name: tool for tool in get_all_tools()}
-    
+        self._info_tool_cache = {}
+
     def execute_function(self, function_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a function call from AI."""
         tool = self.tools.get(function_name)
-        if tool:
-            return tool.execute(bot=self, **arguments)
-        else:
+        if not tool:
             return {"error": f"Unknown function: {function_name}"}
-    
-    def run_trading_session(self, max_iterations: int = 10):
-        """Run an AI trading session."""
+
+        if function_name in _CACHEABLE_TOOLS:
+            key = (function_name, json.dumps(arguments, sort_keys=True))
+            if key in self._info_tool_cache:
+                return self._info_tool_cache[key]
+            result = tool.execute(bot=self, **arguments)
+            self._info_tool_cache[key] = result
+            return result
+
+        return tool.execute(bot=self, **arguments)
+
+    def _execute_tool_calls(self, tool_calls) -> list:
+        """Execute a batch of tool calls, overlapping the read-only ones.
+
+        Read-only tools are network-bound and independent, so they run on a
+        thread pool; mutating tools run serially afterwards in issue order.
+        Results come back in the same order the model issued the calls.
+        """
+        parsed = []
+        for tool_call in tool_calls:
+            function_name = tool_call['function']['name']
+            # Prefer the provider's pre-parsed arguments (Bedrock path) over
+            # re-decoding the JSON string; pop so the side channel never goes
+            # back out in the message history
+            arguments = tool_call.pop('_parsed_input', None)
+            if arguments is None:
+                arguments = json.loads(tool_call['function']['arguments'])
+            print(f"🔧 Calling: {function_name}({json.dumps(arguments, indent=2)})")
+            parsed.append((function_name, arguments))
+
+        results = [None] * len(parsed)
+
+        # Collapse duplicate read-only calls: the model sometimes issues the
+        # same informational call twice in one turn, and each duplicate gets
+        # the first call's result
+        read_indices = []
+        duplicates = {}
+        seen = {}
+        for i, (name, arguments) in enumerate(parsed):
+            if name in _WRITE_TOOLS:
+                continue
+            key = (name, json.dumps(arguments, sort_keys=True))
+            if key in seen:
+                duplicates[i] = seen[key]
+            else:
+                seen[key] = i
+                read_indices.append(i)
+
+        if len(read_indices) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(read_indices))) as executor:
+                futures = {i: executor.submit(self.execute_function, *parsed[i]) for i in read_indices}
+                for i, future in futures.items():
+                    results[i] = future.result()
+        else:
+            for i in read_indices:
+                results[i] = self.execute_function(*parsed[i])
+
+        for i, source in duplicates.items():
+            results[i] = results[source]
+
+        for i, (function_name, arguments) in enumerate(parsed):
+            if function_name in _WRITE_TOOLS:
+                results[i] = self.execute_function(function_name, arguments)
+
+        return results
+
+    def run_trading_session(self, max_iterations: int = 10, iteration_delay: float = 1.0):
+        """Run an AI trading session.
+
+        Args:
+            max_iterations: Maximum number of AI iterations
+            iteration_delay: Pause in seconds between tool-call iterations
+        """
         print("=" * 80)
         print("AI-POWERED POLYMARKET TRADING BOT")
         print("=" * 80)
@@ -120,26 +220,28 @@ class TradingBot:
             # Handle tool calls
             if choice['finish_reason'] == 'tool_calls':
                 tool_calls = message.get('tool_calls', [])
-                
-                for tool_call in tool_calls:
-                    function_name = tool_call['function']['name']
-                    arguments = json.loads(tool_call['function']['arguments'])
-                    
-                    print(f"🔧 Calling: {function_name}({json.dumps(arguments, indent=2)})")
-                    
-                    # Execute function
-                    result = self.execute_function(function_name, arguments)
-                    
-                    # Add result to messages
+
+                results = self._execute_tool_calls(tool_calls)
+
+                for tool_call, result in zip(tool_calls, results):
+                    # Serialize once - the same string feeds the message
+                    # history and the truncated console preview
+                    content = json.dumps(result)
                     messages.append({
                         "role": "tool",
                         "tool_call_id": tool_call['id'],
-                        "content": json.dumps(result)
+                        "content": content
                     })
-                    
-                    print(f"✓ Result: {json.dumps(result, indent=2)[:200]}...")
-            
-            time.sleep(1)
+
+                    print(f"✓ Result: {_preview(content)}")
+
+                # Keep only the most recent tool payloads verbatim so the
+                # resent history doesn't grow quadratically with iterations
+                _trim_tool_history(messages)
+
+            # Pause only between iterations - never after the final one
+            if iteration_delay > 0 and iteration < max_iterations - 1:
+                time.sleep(iteration_delay)
         
         # Final summary
         self._print_summary()
@@ -1,9 +1,32 @@
 """Research and information gathering tools."""
+import functools
 import os
 from typing import Dict, Any
 from .base import BaseTool
 
 
+@functools.lru_cache(maxsize=64)
+def _search_news_cached(query: str, max_results: int) -> Dict[str, Any]:
+    """Run a Google News search, memoized per (query, max_results) for the session."""
+    from pygooglenews import GoogleNews
+    gn = GoogleNews(lang='en', country='US')
+    search = gn.search(query, when='7d')
+    articles = [
+        {
+            'title': e.title,
+            'source': e.source.get('title', 'Unknown'),
+            'published': e.published,
+            'url': e.link
+        }
+        for e in search['entries'][:max_results]
+    ]
+    return {"query": query, "results_count": len(articles), "articles": articles}
+
+
+# Knowledge base cache - (mtime, content), invalidated when kb.txt changes
+_kb_cache = None
+
+
 class SearchNewsTool(BaseTool):
     """Search for recent news."""
     
@@ -37,19 +60,8 @@ class SearchNewsTool(BaseTool):
         """Search for recent news."""
         print(f"  [Searching news for: {query}...]")
         try:
-            from pygooglenews import GoogleNews
-            gn = GoogleNews(lang='en', country='US')
-            search = gn.search(query, when='7d')
-            articles = [
-                {
-                    'title': e.title,
-                    'source': e.source.get('title', 'Unknown'),
-                    'published': e.published,
-                    'url': e.link
-                }
-                for e in search['entries'][:max_results]
-            ]
-            return {"query": query, "results_count": len(articles), "articles": articles}
+            # Cached helper - repeat queries within a session cost nothing
+            return _search_news_cached(query, max_results)
         except Exception as e:
             return {"query": query, "error": str(e), "note": "News unavailable"}
 
@@ -75,15 +87,24 @@ class ReadKnowledgeBaseTool(BaseTool):
     
     def execute(self, bot, **kwargs) -> Dict[str, Any]:
         """Read the trading knowledge base."""
+        global _kb_cache
+
         print(f"  [Reading knowledge base...]")
-        
+
         kb_path = "kb.txt"
-        
+
         try:
             if os.path.exists(kb_path):
-                with open(kb_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
+                mtime = os.path.getmtime(kb_path)
+
+                # Re-read only if the file changed since the last call
+                if _kb_cache and _kb_cache[0] == mtime:
+                    content = _kb_cache[1]
+                else:
+                    with open(kb_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    _kb_cache = (mtime, content)
+
                 return {
                     "available": True,
                     "content": content,
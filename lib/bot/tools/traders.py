@@ -1,5 +1,4 @@
 """Trader analysis tools."""
-import time
 from typing import Dict, Any, List
 from .base import BaseTool
 from ...analysis import (
@@ -9,13 +8,15 @@ from ...analysis import (
     find_consensus_bets,
     analyze_trader
 )
+from ...cache import cache_get, cache_set
+from ...log import logger
 from ...repositories.markets import MarketsRepository
 from ...repositories.wallets import WalletsRepository
 
 
-# Shared cache for top traders
-_top_traders_cache = None
-_cache_time = None
+# Shared cache key for top traders (persisted across restarts)
+_TOP_TRADERS_KEY = ('top_traders', 50)
+_TOP_TRADERS_TTL = 300
 
 
 class GetTopTradersTool(BaseTool):
@@ -45,15 +46,13 @@ class GetTopTradersTool(BaseTool):
     
     def execute(self, bot, n: int = 10, **kwargs) -> List[Dict[str, Any]]:
         """Get top N traders by Sharpe ratio."""
-        global _top_traders_cache, _cache_time
-        
         n = min(n, 50)
-        
-        # Cache for 5 minutes
-        if _top_traders_cache and _cache_time:
-            if time.time() - _cache_time < 300:
-                return _top_traders_cache[:n]
-        
+
+        # Cache for 5 minutes, survives process restarts
+        cached = cache_get(_TOP_TRADERS_KEY)
+        if cached:
+            return cached[:n]
+
         print(f"  [Analyzing top 50 traders from leaderboard...]")
         traders = get_top_traders_by_sharpe(n=50, sample_size=50)
         
@@ -71,9 +70,8 @@ class GetTopTradersTool(BaseTool):
                 "pnl": round(trader.leaderboard_pnl, 2)
             })
         
-        _top_traders_cache = result
-        _cache_time = time.time()
-        
+        cache_set(_TOP_TRADERS_KEY, result, expire=_TOP_TRADERS_TTL)
+
         return result
 
 
@@ -109,26 +107,25 @@ class GetTraderTopTradesTool(BaseTool):
     def execute(self, bot, wallet: str, n: int = 5, **kwargs) -> List[Dict[str, Any]]:
         """Get top trades for a specific trader."""
         print(f"  [Fetching top {n} trades for wallet...]")
-        trades = get_top_volume_trades(wallet, n * 3)
-        
-        markets_repo = MarketsRepository()
+
+        # get_top_volume_trades scans the full fetched history and filters to
+        # active markets, so coming back short means there simply aren't n
+        # active-market trades - no point re-running the sweep
+        trades = get_top_volume_trades(wallet, n)
+
         result = []
-        for trade in trades:
-            if markets_repo.is_active(trade.market_slug):
-                result.append({
-                    "market": trade.market_title,
-                    "market_slug": trade.market_slug,
-                    "outcome": trade.outcome,
-                    "side": trade.side,
-                    "volume_usd": round(trade.value, 2),
-                    "price": round(trade.price, 4),
-                    "shares": round(trade.size, 2),
-                    "status": "active"
-                })
-                
-                if len(result) >= n:
-                    break
-        
+        for trade in trades[:n]:
+            result.append({
+                "market": trade.market_title,
+                "market_slug": trade.market_slug,
+                "outcome": trade.outcome,
+                "side": trade.side,
+                "volume_usd": round(trade.value, 2),
+                "price": round(trade.price, 4),
+                "shares": round(trade.size, 2),
+                "status": "active"
+            })
+
         return result
 
 
@@ -159,18 +156,17 @@ class GetConsensusBetsTool(BaseTool):
     
     def execute(self, bot, min_traders: int = 2, **kwargs) -> List[Dict[str, Any]]:
         """Find consensus bets among top traders and PolyWhaler whales."""
-        global _top_traders_cache
-        
         print(f"  [Finding consensus bets...]")
-        
+
         # Get top traders by Sharpe ratio
-        if not _top_traders_cache:
+        cached_traders = cache_get(_TOP_TRADERS_KEY)
+        if not cached_traders:
             get_top_traders_tool = GetTopTradersTool()
-            get_top_traders_tool.execute(bot, n=10)
-        
+            cached_traders = get_top_traders_tool.execute(bot, n=10)
+
         # Convert cache back to TraderMetrics
         traders = []
-        for t in _top_traders_cache:
+        for t in cached_traders:
             traders.append(TraderMetrics(
                 wallet=t['wallet'],
                 username=t['username'],
@@ -262,21 +258,27 @@ class GetSuggestedWhalesTool(BaseTool):
             return {"error": "PolyWhaler unavailable", "whales": []}
         
         print(f"  [Analyzing {len(whales)} whales for risk metrics...]")
-        enriched_whales = []
-        
-        for w in whales:
-            wallet = w['wallet']
-            print(f"    Analyzing {w.get('name', wallet)}...")
-            
-            metrics = analyze_trader(
-                wallet=wallet,
+
+        def _analyze_whale(w):
+            return analyze_trader(
+                wallet=w['wallet'],
                 username=w.get('name', 'Unknown'),
                 rank=0,
                 vol=w.get('recentVolume', 0),
                 pnl=0,
                 check_resolutions=False  # Fast mode - skip slow resolution checks
             )
-            
+
+        # Each analysis is network-bound, so fan out across a bounded pool
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            analyzed = list(zip(whales, executor.map(_analyze_whale, whales)))
+
+        enriched_whales = []
+
+        for w, metrics in analyzed:
+            wallet = w['wallet']
+
             if metrics:
                 enriched_whales.append({
                     "wallet": wallet,
@@ -347,21 +349,12 @@ class GetSuspiciousEventsTool(BaseTool):
                 events = data.get('events', [])
                 
                 # Filter out old events by checking market question for old years
-                current_year = datetime.now().year
-                filtered_events = []
-                
-                for event in events:
-                    market_question = event.get('marketQuestion', '').lower()
-                    
-                    # Skip if question mentions old years
-                    has_old_year = False
-                    for year in range(2020, current_year):
-                        if str(year) in market_question:
-                            has_old_year = True
-                            break
-                    
-                    if not has_old_year:
-                        filtered_events.append(event)
+                from ...repositories.markets import old_year_pattern
+                stale_years = old_year_pattern(datetime.now().year)
+                filtered_events = [
+                    event for event in events
+                    if not (stale_years and stale_years.search(event.get('marketQuestion', '').lower()))
+                ]
                 
                 print(f"  [Filtered {len(events)} events down to {len(filtered_events)} active markets]")
                 
@@ -426,8 +419,8 @@ class GetPolywhalerLeaderboardTool(BaseTool):
                 for t in traders:
                     wallet = t.get('wallet')
                     trader_name = t.get('traderName', 'Unknown')
-                    
-                    print(f"    Analyzing {trader_name}...")
+
+                    logger.info("Analyzing %s...", trader_name)
                     
                     # Calculate Sharpe ratio and max drawdown
                     metrics = analyze_trader(
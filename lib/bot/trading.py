@@ -2,7 +2,12 @@
 import json
 from typing import Dict, Any, Optional
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
+
+# Default CLOB tick sizes for order price and size; the price tick is
+# per-market (0.01 or 0.001) and overridden from market details when known
+_PRICE_Q = Decimal('0.001')
+_SIZE_Q = Decimal('0.01')
 
 
 class BetPlacer:
@@ -109,7 +114,9 @@ class BetPlacer:
             
             token_id = token_ids[outcome_index]
             
-            # Get current price
+            # Get current price - always a fresh CLOB quote for live orders;
+            # market_info['outcome_prices'] can be served from the on-disk
+            # market-details cache and be up to 10 minutes stale
             from ..repositories.markets import MarketsRepository
             markets_repo = MarketsRepository()
             current_price = markets_repo.get_price(token_id, side='SELL')
@@ -123,10 +130,17 @@ class BetPlacer:
             shares = amount_usd / current_price
             
             # Create and post order
+            # Quantize via str() so the decimal value is preserved (quantizing
+            # the raw float rounds its binary expansion and lands a tick low
+            # half the time). Price rounds half-even to the market's tick;
+            # size rounds down so the order never exceeds the budget.
+            tick = market_info.get('price_tick_size')
+            price_q = Decimal(str(tick)) if tick else _PRICE_Q
+
             order = self.bot.polymarket_client.create_order(
                 OrderArgs(
-                    price=Decimal(str(current_price)),
-                    size=Decimal(str(shares)),
+                    price=Decimal(str(current_price)).quantize(price_q, rounding=ROUND_HALF_EVEN),
+                    size=Decimal(str(shares)).quantize(_SIZE_Q, rounding=ROUND_DOWN),
                     side=BUY,
                     token_id=token_id
                 )
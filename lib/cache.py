@@ -0,0 +1,37 @@
+"""Shared cache for expensive API results, persisted across process restarts."""
+import time
+from typing import Any, Optional
+
+CACHE_DIR = '.pmac_cache'
+
+try:
+    import diskcache
+    _disk_cache = diskcache.Cache(CACHE_DIR)
+except ImportError:
+    _disk_cache = None
+
+# In-memory fallback when diskcache is not installed
+_memory_cache = {}
+
+
+def cache_get(key) -> Optional[Any]:
+    """Get a cached value, or None if missing or expired."""
+    if _disk_cache is not None:
+        return _disk_cache.get(key)
+
+    entry = _memory_cache.get(key)
+    if entry:
+        value, expires_at = entry
+        if expires_at is None or time.time() < expires_at:
+            return value
+        del _memory_cache[key]
+    return None
+
+
+def cache_set(key, value, expire: Optional[float] = None):
+    """Store a value with an optional TTL in seconds."""
+    if _disk_cache is not None:
+        _disk_cache.set(key, value, expire=expire)
+    else:
+        expires_at = time.time() + expire if expire else None
+        _memory_cache[key] = (value, expires_at)
@@ -0,0 +1,31 @@
+"""Buffered logging for hot-loop diagnostics.
+
+User-facing progress stays on print(); per-item messages inside tight or
+threaded loops go through this logger instead, so worker threads enqueue
+records without serializing on the stdout lock. A QueueListener drains the
+queue to stderr on a single background thread.
+
+The level defaults to INFO (sweep progress visible) and can be changed via
+the PMAC_LOG_LEVEL environment variable, e.g. PMAC_LOG_LEVEL=WARNING for
+quiet runs or DEBUG for extra detail.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+_log_queue = queue.SimpleQueue()
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter('%(message)s'))
+_listener = logging.handlers.QueueListener(_log_queue, _handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+logger = logging.getLogger('polymarket_agent')
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+try:
+    logger.setLevel(os.environ.get('PMAC_LOG_LEVEL', 'INFO').upper())
+except ValueError:
+    logger.setLevel(logging.INFO)
@@ -6,8 +6,8 @@ class AIProvider(ABC):
     """Abstract base class for AI providers."""
     
     @abstractmethod
-    def chat(self, messages: List[Dict[str, str]], tools: List[Dict], 
-             retry_count: int = 0, max_retries: int = 5) -> Optional[Dict]:
+    def chat(self, messages: List[Dict[str, str]], tools: List[Dict],
+             max_retries: int = 5) -> Optional[Dict]:
         """Send messages and get response."""
         pass
     
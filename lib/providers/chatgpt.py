@@ -1,70 +1,123 @@
+import random
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional
 from .base import AIProvider
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Transient network failures worth retrying; anything else (bad URL, auth
+# wrapped as an exception, malformed payload) fails fast instead of burning
+# the whole backoff budget
+_RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
 
 class ChatGPTProvider(AIProvider):
     """ChatGPT provider implementation."""
-    
+
     def __init__(self, api_key: str):
         self.api_key = api_key
+
+        # Persistent session keeps the TLS connection to api.openai.com warm
+        # across iterations; retries are handled in chat(), not the adapter
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+        self.http.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # Pre-serialized immutable request-body prefix (model + tools +
+        # tool_choice); only the messages array changes between calls
+        self._body_prefix = None
+        self._body_prefix_src = None
     
     def get_name(self) -> str:
         return "ChatGPT (GPT-4o-mini)"
     
-    def chat(self, messages: List[Dict[str, str]], tools: List[Dict], 
-             retry_count: int = 0, max_retries: int = 5) -> Optional[Dict]:
+    def chat(self, messages: List[Dict[str, str]], tools: List[Dict],
+             max_retries: int = 5) -> Optional[Dict]:
         """
-        Send messages to ChatGPT and get response with exponential backoff retry.
-        
+        Send messages to ChatGPT and get response with jittered backoff retry.
+
         Args:
             messages: List of message dicts with role and content
             tools: List of tool definitions
-            retry_count: Current retry attempt
             max_retries: Maximum number of retries
-        
+
         Returns:
             Response dict from OpenAI API, or None if error
         """
-        try:
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-4o-mini",
-                    "messages": messages,
-                    "tools": tools,
-                    "tool_choice": "auto"
-                },
-                timeout=60
-            )
-            
-            if response.ok:
-                return response.json()
-            elif response.status_code == 429 and retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                print(f"⏳ Rate limited. Retrying in {wait_time}s... (attempt {retry_count + 1}/{max_retries})")
-                time.sleep(wait_time)
-                return self.chat(messages, tools, retry_count + 1, max_retries)
-            elif response.status_code >= 500 and retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                print(f"⏳ Server error. Retrying in {wait_time}s... (attempt {retry_count + 1}/{max_retries})")
-                time.sleep(wait_time)
-                return self.chat(messages, tools, retry_count + 1, max_retries)
-            else:
-                print(f"API Error: {response.status_code} - {response.text}")
+        # Build the body once; retries reuse it. With orjson the static
+        # prefix (model, tools, tool_choice) is serialized once per tools
+        # list and only the messages array is encoded per call.
+        if orjson is not None:
+            if tools is not self._body_prefix_src:
+                self._body_prefix = (
+                    b'{"model":"gpt-4o-mini","tools":' + orjson.dumps(tools) +
+                    b',"tool_choice":"auto","messages":'
+                )
+                self._body_prefix_src = tools
+            request_kwargs = {'data': self._body_prefix + orjson.dumps(messages) + b'}'}
+        else:
+            request_kwargs = {'json': {
+                "model": "gpt-4o-mini",
+                "messages": messages,
+                "tools": tools,
+                "tool_choice": "auto"
+            }}
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.http.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    timeout=60,
+                    **request_kwargs
+                )
+            except _RETRYABLE_EXCEPTIONS as e:
+                if attempt < max_retries:
+                    wait_time = self._backoff(attempt)
+                    print(f"⏳ Error: {e}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(wait_time)
+                    continue
+                print(f"Error calling ChatGPT: {e}")
                 return None
-                
-        except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                print(f"⏳ Error: {e}. Retrying in {wait_time}s... (attempt {retry_count + 1}/{max_retries})")
-                time.sleep(wait_time)
-                return self.chat(messages, tools, retry_count + 1, max_retries)
-            else:
+            except Exception as e:
                 print(f"Error calling ChatGPT: {e}")
                 return None
+
+            if response.ok:
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+
+            if (response.status_code == 429 or response.status_code >= 500) and attempt < max_retries:
+                wait_time = self._backoff(attempt, response.headers.get("Retry-After"))
+                reason = "Rate limited" if response.status_code == 429 else "Server error"
+                print(f"⏳ {reason}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                time.sleep(wait_time)
+                continue
+
+            print(f"API Error: {response.status_code} - {response.text}")
+            return None
+
+        return None
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honoring a Retry-After header if given."""
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return random.random() * (2 ** attempt)
@@ -1,139 +1,259 @@
 import json
+import random
 import time
 from typing import List, Dict, Optional
 from .base import AIProvider
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Decode JSON bytes/str with orjson's fast path when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ClaudeProvider(AIProvider):
     """Claude provider implementation via AWS Bedrock."""
-    
+
     def __init__(self, bedrock_client):
         self.bedrock_client = bedrock_client
-    
+
+        # Cached OpenAI->Claude tool-schema translation; tool definitions are
+        # static for a session, so translate once and reuse
+        self._claude_tools = None
+        self._claude_tools_src = None
+
+        # Incrementally-translated message history: only messages appended
+        # since the last call are converted, instead of re-walking the whole
+        # list every turn. Tool-result translations keep a reference to
+        # their source message so in-place trims still reach Bedrock.
+        self._msg_cache = []
+        self._msg_cursor = 0
+        self._msg_src = None
+        self._system_message = None
+        self._tool_msg_refs = []
+
     def get_name(self) -> str:
         return "Claude Opus 4 (AWS Bedrock)"
-    
+
     def chat(self, messages: List[Dict[str, str]], tools: List[Dict],
-             retry_count: int = 0, max_retries: int = 5) -> Optional[Dict]:
+             max_retries: int = 5) -> Optional[Dict]:
         """
-        Send messages to Claude via AWS Bedrock and get response with exponential backoff retry.
-        
+        Send messages to Claude via AWS Bedrock and get response with jittered backoff retry.
+
         Args:
             messages: List of message dicts with role and content
             tools: List of tool definitions
-            retry_count: Current retry attempt
             max_retries: Maximum number of retries
-        
+
         Returns:
             Response dict in OpenAI format, or None if error
         """
-        try:
-            # Convert OpenAI format to Claude format
-            claude_messages = []
-            system_message = None
-            
-            for msg in messages:
-                if msg['role'] == 'system':
-                    system_message = msg['content']
-                elif msg['role'] == 'tool':
-                    # Convert tool response to user message
-                    claude_messages.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg['tool_call_id'],
-                                "content": msg['content']
-                            }
-                        ]
-                    })
+        for attempt in range(max_retries + 1):
+            try:
+                return self._chat_once(messages, tools)
+            except Exception as e:
+                if attempt < max_retries:
+                    # Full-jitter backoff decorrelates retries across bots
+                    wait_time = random.random() * (2 ** attempt)
+                    print(f"⏳ Error: {e}. Retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                    time.sleep(wait_time)
                 else:
-                    # Handle regular messages and tool calls
-                    content = []
-                    
-                    if msg.get('content'):
-                        content.append({"type": "text", "text": msg['content']})
-                    
-                    if msg.get('tool_calls'):
-                        for tool_call in msg['tool_calls']:
-                            content.append({
-                                "type": "tool_use",
-                                "id": tool_call['id'],
-                                "name": tool_call['function']['name'],
-                                "input": json.loads(tool_call['function']['arguments'])
-                            })
-                    
-                    if content:
-                        claude_messages.append({
-                            "role": msg['role'] if msg['role'] != 'assistant' else 'assistant',
-                            "content": content
-                        })
-            
-            # Convert tools to Claude format
-            claude_tools = []
-            for tool in tools:
-                claude_tools.append({
+                    print(f"Error calling Bedrock: {e}")
+        return None
+
+    def _chat_once(self, messages: List[Dict[str, str]], tools: List[Dict]) -> Dict:
+        """Single Bedrock round-trip: translate, invoke, translate back."""
+        # Convert OpenAI format to Claude format, translating only the
+        # messages appended since the previous call. The cache is keyed on
+        # the history list's identity and resets if a new list shows up.
+        if messages is not self._msg_src or len(messages) < self._msg_cursor:
+            self._msg_cache = []
+            self._msg_cursor = 0
+            self._msg_src = messages
+            self._system_message = None
+            self._tool_msg_refs = []
+
+        for msg in messages[self._msg_cursor:]:
+            if msg['role'] == 'system':
+                self._system_message = msg['content']
+            else:
+                translated = self._translate_message(msg)
+                if translated:
+                    self._msg_cache.append(translated)
+                    if msg['role'] == 'tool':
+                        self._tool_msg_refs.append((msg, translated))
+        self._msg_cursor = len(messages)
+
+        # Re-sync tool-result content: the bot elides older tool payloads in
+        # place (see _trim_tool_history), and the cached translation must
+        # reflect that instead of resending the captured full payload
+        for source, translated in self._tool_msg_refs:
+            block = translated['content'][0]
+            if block['content'] is not source['content']:
+                block['content'] = source['content']
+
+        claude_messages = self._msg_cache
+        system_message = self._system_message
+
+        # Convert tools to Claude format, rebuilt only when the tool list changes
+        if tools is not self._claude_tools_src:
+            self._claude_tools = [
+                {
                     "name": tool['function']['name'],
                     "description": tool['function']['description'],
                     "input_schema": tool['function']['parameters']
-                })
-            
-            # Call Bedrock
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 4096,
-                "messages": claude_messages,
-                "tools": claude_tools
-            }
-            
-            if system_message:
-                request_body["system"] = system_message
-            
-            response = self.bedrock_client.invoke_model(
-                modelId="us.anthropic.claude-opus-4-20250514-v1:0",
-                body=json.dumps(request_body)
-            )
-            
-            response_body = json.loads(response['body'].read())
-            
-            # Convert Claude response to OpenAI format
-            openai_response = {
-                "choices": [{
-                    "message": {
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": []
+                }
+                for tool in tools
+            ]
+            # Cache breakpoint after the last tool so Bedrock serves the whole
+            # tool block from the prompt cache on subsequent turns
+            if self._claude_tools:
+                self._claude_tools[-1]["cache_control"] = {"type": "ephemeral"}
+            self._claude_tools_src = tools
+        claude_tools = self._claude_tools
+
+        # Call Bedrock
+        request_body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 4096,
+            "messages": claude_messages,
+            "tools": claude_tools
+        }
+
+        if system_message:
+            # Mark the static system prompt cacheable - it's identical every
+            # iteration, so cache hits cut both cost and time-to-first-token
+            request_body["system"] = [{
+                "type": "text",
+                "text": system_message,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
+        # Stream the response so content blocks are assembled as they arrive
+        # instead of blocking on the full body before any parsing starts
+        body = orjson.dumps(request_body) if orjson is not None else json.dumps(request_body)
+        response = self.bedrock_client.invoke_model_with_response_stream(
+            modelId="us.anthropic.claude-opus-4-20250514-v1:0",
+            body=body
+        )
+
+        content_blocks, stop_reason = self._assemble_stream(response['body'])
+
+        # Convert Claude response to OpenAI format
+        openai_response = {
+            "choices": [{
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": []
+                },
+                "finish_reason": stop_reason
+            }]
+        }
+
+        # Extract content and tool calls
+        for content_block in content_blocks:
+            if content_block['type'] == 'text':
+                openai_response['choices'][0]['message']['content'] = content_block['text']
+            elif content_block['type'] == 'tool_use':
+                arguments = content_block['input_json'] or '{}'
+                openai_response['choices'][0]['message']['tool_calls'].append({
+                    "id": content_block['id'],
+                    "type": "function",
+                    "function": {
+                        "name": content_block['name'],
+                        "arguments": arguments
                     },
-                    "finish_reason": response_body.get('stop_reason', 'stop')
-                }]
+                    # Side channel so the bot doesn't re-parse the arguments
+                    # string we just assembled; popped before the message is
+                    # sent back to the API
+                    "_parsed_input": json.loads(arguments)
+                })
+
+        # Set finish reason
+        if openai_response['choices'][0]['message']['tool_calls']:
+            openai_response['choices'][0]['finish_reason'] = 'tool_calls'
+
+        return openai_response
+
+    @staticmethod
+    def _translate_message(msg: Dict) -> Optional[Dict]:
+        """Translate one OpenAI-format message to Claude format."""
+        if msg['role'] == 'tool':
+            # Convert tool response to user message
+            return {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": msg['tool_call_id'],
+                        "content": msg['content']
+                    }
+                ]
             }
-            
-            # Extract content and tool calls
-            for content_block in response_body.get('content', []):
-                if content_block['type'] == 'text':
-                    openai_response['choices'][0]['message']['content'] = content_block['text']
-                elif content_block['type'] == 'tool_use':
-                    openai_response['choices'][0]['message']['tool_calls'].append({
-                        "id": content_block['id'],
-                        "type": "function",
-                        "function": {
-                            "name": content_block['name'],
-                            "arguments": json.dumps(content_block['input'])
-                        }
+
+        # Handle regular messages and tool calls
+        content = []
+
+        if msg.get('content'):
+            content.append({"type": "text", "text": msg['content']})
+
+        if msg.get('tool_calls'):
+            for tool_call in msg['tool_calls']:
+                content.append({
+                    "type": "tool_use",
+                    "id": tool_call['id'],
+                    "name": tool_call['function']['name'],
+                    "input": json.loads(tool_call['function']['arguments'])
+                })
+
+        if not content:
+            return None
+
+        return {
+            "role": msg['role'] if msg['role'] != 'assistant' else 'assistant',
+            "content": content
+        }
+
+    @staticmethod
+    def _assemble_stream(stream):
+        """Assemble streamed Bedrock events into content blocks.
+
+        Returns (content_blocks, stop_reason) where tool_use blocks carry
+        their raw 'input_json' string accumulated from input_json_delta
+        events.
+        """
+        content_blocks = []
+        stop_reason = 'stop'
+
+        for event in stream:
+            chunk = _loads(event['chunk']['bytes'])
+            event_type = chunk.get('type')
+
+            if event_type == 'content_block_start':
+                block = chunk.get('content_block', {})
+                if block.get('type') == 'text':
+                    content_blocks.append({'type': 'text', 'text': block.get('text', '')})
+                elif block.get('type') == 'tool_use':
+                    content_blocks.append({
+                        'type': 'tool_use',
+                        'id': block.get('id'),
+                        'name': block.get('name'),
+                        'input_json': ''
                     })
-            
-            # Set finish reason
-            if openai_response['choices'][0]['message']['tool_calls']:
-                openai_response['choices'][0]['finish_reason'] = 'tool_calls'
-            
-            return openai_response
-            
-        except Exception as e:
-            if retry_count < max_retries:
-                wait_time = 2 ** retry_count
-                print(f"⏳ Error: {e}. Retrying in {wait_time}s... (attempt {retry_count + 1}/{max_retries})")
-                time.sleep(wait_time)
-                return self.chat(messages, tools, retry_count + 1, max_retries)
-            else:
-                print(f"Error calling Bedrock: {e}")
-                return None
+            elif event_type == 'content_block_delta' and content_blocks:
+                delta = chunk.get('delta', {})
+                if delta.get('type') == 'text_delta':
+                    content_blocks[-1]['text'] += delta.get('text', '')
+                elif delta.get('type') == 'input_json_delta':
+                    content_blocks[-1]['input_json'] += delta.get('partial_json', '')
+            elif event_type == 'message_delta':
+                stop_reason = chunk.get('delta', {}).get('stop_reason') or stop_reason
+
+        return content_blocks, stop_reason
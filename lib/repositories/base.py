@@ -1,14 +1,26 @@
 import requests
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def decode_json(response):
+    """Decode a response body, using orjson's fast path when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class BaseRepository:
     """Base repository with common request handling."""
-    
+
     def __init__(self, base_url: str, timeout: int = 10):
         self.base_url = base_url
         self.timeout = timeout
-    
+
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
         """Make GET request and return JSON response."""
         try:
@@ -18,7 +30,7 @@ class BaseRepository:
                 timeout=self.timeout
             )
             if response.ok:
-                return response.json()
+                return decode_json(response)
         except Exception as e:
             print(f"Error in GET {endpoint}: {e}")
         return None
@@ -1,6 +1,43 @@
+import functools
+import re
 from typing import List, Dict, Optional
 from datetime import datetime
+from types import MappingProxyType
 from .base import BaseRepository
+from ..cache import cache_get, cache_set
+
+
+@functools.lru_cache(maxsize=8)
+def old_year_pattern(current_year: int) -> Optional[re.Pattern]:
+    """Compiled alternation of stale years (2020..current_year-1).
+
+    One regex pass over a question beats a substring scan per year; cached
+    per calendar year so the pattern is compiled once.
+    """
+    years = [str(year) for year in range(2020, current_year)]
+    if not years:
+        return None
+    return re.compile('|'.join(years))
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_iso(ts: str) -> Optional[datetime]:
+    """Parse a gamma ISO timestamp, cached - the same strings recur across calls."""
+    try:
+        return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
+# Market details change slowly; cache for 10 minutes across restarts
+_MARKET_DETAILS_TTL = 600
+
+# Fixed trading info block - identical for every market, so build it once
+_TRADING_INFO = MappingProxyType({
+    "minimum_trade": "No minimum (can trade fractional shares)",
+    "settlement": "Shares worth $1 if outcome occurs, $0 otherwise",
+    "liquidity": "Can exit position anytime at current market price"
+})
 
 
 class MarketsRepository(BaseRepository):
@@ -18,30 +55,35 @@ class MarketsRepository(BaseRepository):
         return self._get(f"/markets/slug/{slug}")
     
     def get_active_markets(self, limit: int = 20) -> List[Dict]:
-        """Get active markets using closed=false API parameter."""
-        # Use the API's closed parameter to filter at source
+        """Get active markets, filtered server-side via gamma query parameters."""
+        # Push all status filters to the API so we don't download and parse
+        # rows that would be rejected client-side anyway
         raw_markets = self._get_list("/markets", params={
             'limit': limit,
             'closed': 'false',
-            'active': 'true'
+            'active': 'true',
+            'accepting_orders': 'true',
+            'end_date_min': datetime.utcnow().isoformat()
         })
-        
+
         if not raw_markets:
             return []
-        
+
         # Additional filtering for quality
-        current_year = datetime.now().year
+        stale_years = old_year_pattern(datetime.now().year)
         filtered_markets = []
-        
+
         for market in raw_markets:
-            # Skip if not accepting orders
-            if not market.get('acceptingOrders', False):
+            # Sanity check: these are filtered server-side via the query
+            # params above, but keep the cheap local guard in case gamma
+            # ignores or renames one of them
+            if not market.get('active', False) or market.get('closed', True) \
+                    or not market.get('acceptingOrders', False):
                 continue
-            
+
             # Skip if question mentions old years (2020-2023)
             question = market.get('question', '').lower()
-            has_old_year = any(str(year) in question for year in range(2020, current_year))
-            if has_old_year:
+            if stale_years and stale_years.search(question):
                 continue
             
             # Normalize the slug field name for consistency
@@ -95,37 +137,33 @@ class MarketsRepository(BaseRepository):
         # Check end date - reject if already passed
         end_date = market.get('endDate')
         if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                now = datetime.now(end_dt.tzinfo)
-                if now > end_dt:
-                    return False
-            except:
-                pass
-        
+            end_dt = _parse_iso(end_date)
+            if end_dt and datetime.now(end_dt.tzinfo) > end_dt:
+                return False
+
         # Check if market is too old (created more than 2 years ago)
         created_at = market.get('createdAt')
         if created_at:
-            try:
-                created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                now = datetime.now(created_dt.tzinfo)
-                age_days = (now - created_dt).days
+            created_dt = _parse_iso(created_at)
+            if created_dt:
+                age_days = (datetime.now(created_dt.tzinfo) - created_dt).days
                 if age_days > 730:  # More than 2 years old
                     return False
-            except:
-                pass
         
         # Check if question mentions old dates (like "2020", "2021", "2022", "2023")
         question = market.get('question', '').lower()
-        current_year = datetime.now().year
-        for year in range(2020, current_year):
-            if str(year) in question:
-                return False
-        
+        stale_years = old_year_pattern(datetime.now().year)
+        if stale_years and stale_years.search(question):
+            return False
+
         return is_active and not is_closed and accepting_orders
     
     def get_market_details(self, market_slug: str) -> Optional[Dict]:
         """Get comprehensive market details including status and trading info."""
+        cached = cache_get(('market_details', market_slug))
+        if cached is not None:
+            return cached
+
         market = self.get_by_slug(market_slug)
         
         if not market:
@@ -152,11 +190,13 @@ class MarketsRepository(BaseRepository):
             outcomes = []
             token_ids = []
         
-        # Fetch current prices
+        # Fetch current prices - one CLOB call per outcome, so do them in parallel
         outcome_prices = {}
         if outcomes and token_ids and len(outcomes) == len(token_ids):
-            for outcome, token_id in zip(outcomes, token_ids):
-                price = self.get_price(token_id, side='SELL')
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(4, len(token_ids))) as executor:
+                prices = list(executor.map(lambda tid: self.get_price(tid, side='SELL'), token_ids))
+            for outcome, token_id, price in zip(outcomes, token_ids, prices):
                 if price:
                     outcome_prices[outcome] = {
                         "current_price": round(price, 4),
@@ -182,11 +222,8 @@ class MarketsRepository(BaseRepository):
             "outcomes": outcomes_str,
             "condition_id": market.get('conditionId', ''),
             "clob_token_ids": token_ids_str,
-            "trading_info": {
-                "minimum_trade": "No minimum (can trade fractional shares)",
-                "settlement": "Shares worth $1 if outcome occurs, $0 otherwise",
-                "liquidity": "Can exit position anytime at current market price"
-            }
+            "price_tick_size": market.get('orderPriceMinTickSize', 0.001),
+            "trading_info": dict(_TRADING_INFO)
         }
         
         # Add outcome prices if available
@@ -199,22 +236,20 @@ class MarketsRepository(BaseRepository):
         
         # Add warning for old markets
         question = market.get('question', '').lower()
-        current_year = datetime.now().year
-        for year in range(2020, current_year):
-            if str(year) in question:
-                result["warning"] = f"⚠️ OLD MARKET - Question mentions {year}. This market is likely resolved or outdated."
-                break
+        stale_years = old_year_pattern(datetime.now().year)
+        stale_match = stale_years.search(question) if stale_years else None
+        if stale_match:
+            result["warning"] = f"⚠️ OLD MARKET - Question mentions {stale_match.group()}. This market is likely resolved or outdated."
         
         # Check if market is very old
         created_at = market.get('createdAt')
         if created_at:
-            try:
-                created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                now = datetime.now(created_dt.tzinfo)
-                age_days = (now - created_dt).days
+            created_dt = _parse_iso(created_at)
+            if created_dt:
+                age_days = (datetime.now(created_dt.tzinfo) - created_dt).days
                 if age_days > 730:
                     result["warning"] = f"⚠️ VERY OLD MARKET - Created {age_days} days ago. Likely resolved or outdated."
-            except:
-                pass
-        
+
+        cache_set(('market_details', market_slug), result, expire=_MARKET_DETAILS_TTL)
+
         return result
@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+import os
+
 import numpy as np
 from typing import List, Tuple
 from collections import Counter
@@ -9,34 +10,48 @@ from .analysis import TraderMetrics
 
 def create_visualizations(traders: List[TraderMetrics], consensus: List[Tuple[str, str, int, float]]):
     """Create insightful visualizations of trader data."""
-    
+    # Imported lazily - matplotlib costs hundreds of ms on cold caches and
+    # only the --plot path needs it. Headless runs get the Agg backend so no
+    # GUI toolkit is initialized just to write a PNG.
+    import matplotlib
+    if not os.environ.get('DISPLAY'):
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
     print("\nGenerating visualizations...")
     
     # Create figure with 3x3 subplots
     fig, axes = plt.subplots(3, 3, figsize=(24, 18))
     fig.suptitle('Polymarket Top Traders Analysis', fontsize=20, fontweight='bold', y=0.995)
-    
-    # Extract common data
-    sharpes = [t.sharpe_ratio for t in traders]
+
+    # Extract the metric arrays once - each panel reuses them instead of
+    # re-walking the trader list per subplot
+    ranks = np.fromiter((t.leaderboard_rank for t in traders), dtype=np.int64)
+    sharpes = np.fromiter((t.sharpe_ratio for t in traders), dtype=np.float64)
+    win_rates = np.fromiter((t.win_rate for t in traders), dtype=np.float64)
+    drawdowns = np.fromiter((t.max_drawdown for t in traders), dtype=np.float64)
+    volatilities = np.fromiter((t.volatility for t in traders), dtype=np.float64)
+    volumes = np.fromiter((t.leaderboard_vol for t in traders), dtype=np.float64)
+    pnls = np.fromiter((t.leaderboard_pnl for t in traders), dtype=np.float64)
     colors = plt.cm.viridis(np.linspace(0, 1, len(traders)))
-    
+
     # 1. Sharpe Ratio vs Leaderboard Rank
-    _plot_sharpe_vs_rank(axes[0, 0], traders, colors)
-    
+    _plot_sharpe_vs_rank(axes[0, 0], ranks, sharpes, colors)
+
     # 2. Sharpe Ratio Distribution
-    _plot_sharpe_distribution(axes[0, 1], traders, colors)
-    
+    _plot_sharpe_distribution(axes[0, 1], traders, sharpes, colors)
+
     # 3. Volume vs P&L
-    _plot_volume_vs_pnl(axes[0, 2], traders, sharpes)
-    
+    _plot_volume_vs_pnl(axes[0, 2], volumes, pnls, sharpes)
+
     # 4. Win Rate vs Sharpe Ratio
-    _plot_win_rate_vs_sharpe(axes[1, 0], traders, colors)
-    
+    _plot_win_rate_vs_sharpe(axes[1, 0], win_rates, sharpes, colors)
+
     # 5. Max Drawdown vs Sharpe Ratio
-    _plot_drawdown_vs_sharpe(axes[1, 1], traders, colors)
-    
+    _plot_drawdown_vs_sharpe(axes[1, 1], drawdowns, sharpes, colors)
+
     # 6. Risk-Return Profile
-    _plot_risk_return(axes[1, 2], traders, colors)
+    _plot_risk_return(axes[1, 2], volatilities, sharpes, colors)
     
     # 7. Consensus Bets Distribution
     _plot_consensus_distribution(axes[2, 0], consensus)
@@ -61,19 +76,19 @@ def create_visualizations(traders: List[TraderMetrics], consensus: List[Tuple[st
     print(f"\n✓ Visualizations saved to: {filename}")
     print(f"✓ Generated 9 plots in 3x3 grid")
     
-    plt.show()
+    # Only open a window when a display is actually available; the PNG above
+    # is the canonical output either way
+    if os.environ.get('DISPLAY'):
+        plt.show()
     plt.close()
 
 
-def _plot_sharpe_vs_rank(ax, traders: List[TraderMetrics], colors):
+def _plot_sharpe_vs_rank(ax, ranks, sharpes, colors):
     """Plot Sharpe Ratio vs Leaderboard Rank."""
-    ranks = [t.leaderboard_rank for t in traders]
-    sharpes = [t.sharpe_ratio for t in traders]
-    
     ax.scatter(ranks, sharpes, c=colors, s=200, alpha=0.6, edgecolors='black', linewidth=2)
-    
-    for i, trader in enumerate(traders):
-        ax.annotate(f"#{i+1}", (trader.leaderboard_rank, trader.sharpe_ratio),
+
+    for i, (rank, sharpe) in enumerate(zip(ranks, sharpes), 1):
+        ax.annotate(f"#{i}", (rank, sharpe),
                    fontsize=8, ha='center', va='center', fontweight='bold')
     
     ax.set_xlabel('Leaderboard Rank (by P&L)', fontsize=12, fontweight='bold')
@@ -83,11 +98,9 @@ def _plot_sharpe_vs_rank(ax, traders: List[TraderMetrics], colors):
     ax.invert_xaxis()
 
 
-def _plot_sharpe_distribution(ax, traders: List[TraderMetrics], colors):
+def _plot_sharpe_distribution(ax, traders: List[TraderMetrics], sharpes, colors):
     """Plot Sharpe Ratio Distribution."""
-    sharpe_values = [t.sharpe_ratio for t in traders]
-    
-    ax.barh(range(len(traders)), sharpe_values, color=colors, edgecolor='black', linewidth=1.5)
+    ax.barh(range(len(traders)), sharpes, color=colors, edgecolor='black', linewidth=1.5)
     ax.set_yticks(range(len(traders)))
     ax.set_yticklabels([f"#{i+1} {t.username[:15]}" for i, t in enumerate(traders)], fontsize=9)
     ax.set_xlabel('Sharpe Ratio', fontsize=12, fontweight='bold')
@@ -96,16 +109,15 @@ def _plot_sharpe_distribution(ax, traders: List[TraderMetrics], colors):
     ax.axvline(x=0, color='red', linestyle='--', linewidth=2, alpha=0.7)
 
 
-def _plot_volume_vs_pnl(ax, traders: List[TraderMetrics], sharpes: List[float]):
+def _plot_volume_vs_pnl(ax, volumes, pnls, sharpes):
     """Plot Volume vs P&L."""
-    volumes = [t.leaderboard_vol for t in traders]
-    pnls = [t.leaderboard_pnl for t in traders]
-    
+    import matplotlib.pyplot as plt
+
     scatter = ax.scatter(volumes, pnls, c=sharpes, s=300, alpha=0.6,
                         cmap='RdYlGn', edgecolors='black', linewidth=2)
-    
-    for i, trader in enumerate(traders):
-        ax.annotate(f"#{i+1}", (trader.leaderboard_vol, trader.leaderboard_pnl),
+
+    for i, (volume, pnl) in enumerate(zip(volumes, pnls), 1):
+        ax.annotate(f"#{i}", (volume, pnl),
                    fontsize=8, ha='center', va='center', fontweight='bold')
     
     ax.set_xlabel('Trading Volume ($)', fontsize=12, fontweight='bold')
@@ -119,15 +131,12 @@ def _plot_volume_vs_pnl(ax, traders: List[TraderMetrics], sharpes: List[float]):
     cbar.set_label('Sharpe Ratio', fontsize=10, fontweight='bold')
 
 
-def _plot_win_rate_vs_sharpe(ax, traders: List[TraderMetrics], colors):
+def _plot_win_rate_vs_sharpe(ax, win_rates, sharpes, colors):
     """Plot Win Rate vs Sharpe Ratio."""
-    win_rates = [t.win_rate for t in traders]
-    sharpes = [t.sharpe_ratio for t in traders]
-    
     ax.scatter(win_rates, sharpes, c=colors, s=200, alpha=0.6, edgecolors='black', linewidth=2)
-    
-    for i, trader in enumerate(traders):
-        ax.annotate(f"#{i+1}", (trader.win_rate, trader.sharpe_ratio),
+
+    for i, (win_rate, sharpe) in enumerate(zip(win_rates, sharpes), 1):
+        ax.annotate(f"#{i}", (win_rate, sharpe),
                    fontsize=8, ha='center', va='center', fontweight='bold')
     
     ax.set_xlabel('Win Rate (%)', fontsize=12, fontweight='bold')
@@ -136,15 +145,12 @@ def _plot_win_rate_vs_sharpe(ax, traders: List[TraderMetrics], colors):
     ax.grid(True, alpha=0.3)
 
 
-def _plot_drawdown_vs_sharpe(ax, traders: List[TraderMetrics], colors):
+def _plot_drawdown_vs_sharpe(ax, drawdowns, sharpes, colors):
     """Plot Max Drawdown vs Sharpe Ratio."""
-    drawdowns = [t.max_drawdown for t in traders]
-    sharpes = [t.sharpe_ratio for t in traders]
-    
     ax.scatter(drawdowns, sharpes, c=colors, s=200, alpha=0.6, edgecolors='black', linewidth=2)
-    
-    for i, trader in enumerate(traders):
-        ax.annotate(f"#{i+1}", (trader.max_drawdown, trader.sharpe_ratio),
+
+    for i, (drawdown, sharpe) in enumerate(zip(drawdowns, sharpes), 1):
+        ax.annotate(f"#{i}", (drawdown, sharpe),
                    fontsize=8, ha='center', va='center', fontweight='bold')
     
     ax.set_xlabel('Max Drawdown (%)', fontsize=12, fontweight='bold')
@@ -156,15 +162,12 @@ def _plot_drawdown_vs_sharpe(ax, traders: List[TraderMetrics], colors):
     ax.legend()
 
 
-def _plot_risk_return(ax, traders: List[TraderMetrics], colors):
+def _plot_risk_return(ax, volatilities, sharpes, colors):
     """Plot Risk-Return Profile."""
-    volatilities = [t.volatility for t in traders]
-    sharpes = [t.sharpe_ratio for t in traders]
-    
     ax.scatter(volatilities, sharpes, c=colors, s=200, alpha=0.6, edgecolors='black', linewidth=2)
-    
-    for i, trader in enumerate(traders):
-        ax.annotate(f"#{i+1}", (trader.volatility, trader.sharpe_ratio),
+
+    for i, (volatility, sharpe) in enumerate(zip(volatilities, sharpes), 1):
+        ax.annotate(f"#{i}", (volatility, sharpe),
                    fontsize=8, ha='center', va='center', fontweight='bold')
     
     ax.set_xlabel('Volatility (Std Dev of Returns)', fontsize=12, fontweight='bold')
@@ -202,6 +205,8 @@ def _plot_consensus_distribution(ax, consensus: List[Tuple[str, str, int, float]
 
 def _plot_top_consensus(ax, consensus: List[Tuple[str, str, int, float]]):
     """Plot Top Consensus Bets by Volume."""
+    import matplotlib.pyplot as plt
+
     if consensus:
         top_consensus = consensus[:10]
         market_labels = [f"{c[0][:30]}..." if len(c[0]) > 30 else c[0] for c in top_consensus]
@@ -228,17 +233,23 @@ def _plot_top_consensus(ax, consensus: List[Tuple[str, str, int, float]]):
 
 def _plot_performance_heatmap(ax, traders: List[TraderMetrics], sharpes: List[float]):
     """Plot Trader Performance Heatmap."""
-    metrics_data = []
+    import matplotlib.pyplot as plt
+
     metric_names = ['Sharpe\nRatio', 'Win\nRate', 'P&L\nRank', 'Low\nDrawdown']
-    
-    for trader in traders:
-        sharpe_norm = (trader.sharpe_ratio - min(sharpes)) / (max(sharpes) - min(sharpes)) if max(sharpes) != min(sharpes) else 0.5
-        win_norm = trader.win_rate / 100
-        pnl_norm = 1 - (trader.leaderboard_rank - 1) / 49
-        drawdown_norm = 1 - abs(trader.max_drawdown) / 100 if trader.max_drawdown < 0 else 1
-        
-        metrics_data.append([sharpe_norm, win_norm, pnl_norm, drawdown_norm])
-    
+
+    # Build the (N, 4) metric matrix in one shot and normalize the Sharpe
+    # column vectorized - min/max computed once, not per trader
+    metrics_data = np.array([
+        [t.sharpe_ratio,
+         t.win_rate / 100,
+         1 - (t.leaderboard_rank - 1) / 49,
+         1 - min(abs(t.max_drawdown), 100) / 100 if t.max_drawdown < 0 else 1.0]
+        for t in traders
+    ])
+    sharpe_col = metrics_data[:, 0]
+    lo, hi = sharpe_col.min(), sharpe_col.max()
+    metrics_data[:, 0] = 0.5 if hi == lo else (sharpe_col - lo) / (hi - lo)
+
     im = ax.imshow(metrics_data, cmap='RdYlGn', aspect='auto', vmin=0, vmax=1)
     
     ax.set_xticks(range(len(metric_names)))